@@ -380,7 +380,7 @@ class CarInterface(CarInterfaceBase):
     if self.CC.scc_smoother is not None:
       self.CC.scc_smoother.inject_events(events)
 
-    ret.events = events.to_msg()
+    events.fill_msg(ret.init('events', len(events)))
 
     self.CS.out = ret.as_reader()
     return self.CS.out
@@ -748,17 +748,16 @@ class Controls:
     self.pm.send('controlsState', dat)
 
     # carState
-    car_events = self.events.to_msg()
     cs_send = messaging.new_message('carState')
     cs_send.valid = CS.canValid
     cs_send.carState = CS
-    cs_send.carState.events = car_events
+    self.events.fill_msg(cs_send.carState.init('events', len(self.events)))
     self.pm.send('carState', cs_send)
 
     # carEvents - logged every second or on change
     if (self.sm.frame % int(1. / DT_CTRL) == 0) or (self.events.names != self.events_prev):
       ce_send = messaging.new_message('carEvents', len(self.events))
-      ce_send.carEvents = car_events
+      self.events.fill_msg(ce_send.carEvents)
       self.pm.send('carEvents', ce_send)
     self.events_prev = self.events.names.copy()
 